@@ -58,38 +58,14 @@ class DSOX(Keysight):
     def measureStatistics(self):
         """Returns an array of dictionaries from the current statistics window.
 
-        The definition of the returned dictionary can be easily gleaned
-        from the code below.
+        The keys of each returned dictionary are listed in Keysight._statKeys.
         """
 
         # turn on the statistics display - these are specific to MSOX/DSOX
-        self._instWrite("SYSTem:MENU MEASure")
-        self._instWrite("MEASure:STATistics:DISPlay ON")
+        self._instWriteCompound(["SYSTem:MENU MEASure",
+                                 "MEASure:STATistics:DISPlay ON"])
 
-        statFlat = super(DSOX, self)._measureStatistics()
-        
-        # convert the flat list into a two-dimentional matrix with seven columns per row
-        cols = 7
-        if ((len(statFlat) % cols != 0)):
-            print('Unexpected response. Oscilloscope may not have any measurements enabled.')
-            statMat = []
-        else:
-            statMat = [statFlat[i:i+cols] for i in range(0,len(statFlat),cols)]
-        
-        # convert each row into a dictionary, while converting text strings into numbers
-        stats = []
-        for stat in statMat:
-            stats.append({'label':stat[0],
-                          'CURR':float(stat[1]),   # Current Value
-                          'MIN':float(stat[2]),    # Minimum Value
-                          'MAX':float(stat[3]),    # Maximum Value
-                          'MEAN':float(stat[4]),   # Average/Mean Value
-                          'STDD':float(stat[5]),   # Standard Deviation
-                          'COUN':int(stat[6])      # Count of measurements
-                          })
-
-        # return the result in an array of dictionaries
-        return stats
+        return super(DSOX, self).measureStatistics()
 
 class MSOX(DSOX):
     """Basic class for controlling and accessing a HP/Agilent/Keysight Generic MSO-X Oscilloscope"""
@@ -40,12 +40,6 @@ except Exception:
     sys.path.append(os.getcwd())
     from mxr import MXR
 
-from time import sleep
-from datetime import datetime
-from quantiphy import Quantity
-from sys import version_info
-import pyvisa as visa
-
 class EXR(MXR):
     """Basic class for controlling and accessing a Keysight EXR Series Oscilloscope
 
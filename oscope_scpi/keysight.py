@@ -45,6 +45,7 @@ from datetime import datetime
 from sys import version_info
 import numpy as np
 import struct
+import pyvisa as visa
 
 class Keysight(Oscilloscope):
     """Child class of Oscilloscope for controlling and accessing a HP/Agilent/Keysight Oscilloscope with PyVISA and SCPI commands"""
@@ -93,6 +94,10 @@ class Keysight(Oscilloscope):
         self._annotationText = ''
         self._annotationColor = 'ch1' # default to Channel 1 color
 
+        # When not None, _measure() appends its query strings to this
+        # list instead of querying the oscilloscope. See measureTblCallMany()
+        self._measureQueries = None
+
 
     def modeRun(self):
         """ Set Oscilloscope to RUN Mode """
@@ -126,19 +131,29 @@ class Keysight(Oscilloscope):
         # Save annotation text because may need it if change color
         self._annotationText = text
 
-        # Next, if <= self._versionLegacy, set color first. if > self._versionLegacy,
-        # annotateColor() also displays the annotation. Also handles
-        # case of color is None.
-        self.annotateColor(color)
-        
-        if (self._version <= self._versionLegacy):
+        if (self._version > self._versionLegacy):
+            # annotateColor() also displays the annotation. Also
+            # handles case of color is None.
+            self.annotateColor(color)
+        else:
             # Legacy commands for annotations
             #
-            # Add an annotation to the screen
-            self._instWrite("DISPlay:ANN:BACKground {}".format(background))   # transparent background - can also be OPAQue or INVerted
-            self._instWrite('DISPlay:ANN:TEXT "{}"'.format(text))
-            self._instWrite("DISPlay:ANN ON")
+            # Set color first, unless it is None, and then add an
+            # annotation to the screen. All sent as a single compound
+            # command to save round-trips to the oscilloscope.
+            cmds = []
+            if (color is not None):
+                cmds.append(self._annColorCmd % color)
+            cmds.append(self._annBackgroundCmd % background)   # transparent background - can also be OPAQue or INVerted
+            cmds.append(self._annTextCmd % text)
+            cmds.append("DISPlay:ANN ON")
+            self._instWriteCompound(cmds)
             
+    ## Legacy annotation command templates, filled in with the % operator
+    _annColorCmd = "DISPlay:ANN:COLor %s"
+    _annBackgroundCmd = "DISPlay:ANN:BACKground %s"
+    _annTextCmd = 'DISPlay:ANN:TEXT "%s"'
+
     ## Use to convert legacy color names
     _colorNameOldtoNew = {
         'ch1':    'CHAN1',
@@ -172,22 +187,23 @@ class Keysight(Oscilloscope):
                 # save color
                 self._annotationColor = color
 
-            # Place Bookmark in top left of grid
-            self._instWrite("DISPlay:BOOKmark1:XPOSition 0.015")
-            self._instWrite("DISPlay:BOOKmark1:YPOSition 0.06")
-
             #@@@#print("Current Location of Bookmark 1: {},{}".format(
             #@@@#    self._instQuery("DISPlay:BOOKmark1:XPOSition?"), self._instQuery("DISPlay:BOOKmark1:YPOSition?")))
             
-            # Always use the first Bookmark to implement similar annotation to 3000 series
-            self._instWrite('DISPlay:BOOKmark1:SET NONE,\"{}\",{},\"{}\"'.format(
-                self._annotationText,
-                self._colorNameOldtoNew[self._annotationColor],
-                self._annotationText))
+            # Place Bookmark in top left of grid and always use the
+            # first Bookmark to implement similar annotation to 3000
+            # series - sent as a single compound command
+            self._instWriteCompound([
+                "DISPlay:BOOKmark1:XPOSition 0.015",
+                "DISPlay:BOOKmark1:YPOSition 0.06",
+                'DISPlay:BOOKmark1:SET NONE,\"{}\",{},\"{}\"'.format(
+                    self._annotationText,
+                    self._colorNameOldtoNew[self._annotationColor],
+                    self._annotationText)])
             
         elif (color is not None):
             # If legacy and color is None, ignore
-            self._instWrite("DISPlay:ANN:COLor {}".format(color))
+            self._instWrite(self._annColorCmd % color)
 
     def annotateOff(self):
         """ Turn off screen annotation """
@@ -217,8 +233,8 @@ class Keysight(Oscilloscope):
         if (self.channel not in self._chanAnaValidList):
             raise ValueError('INVALID Channel Value for CHANNEL LABEL: {}  SKIPPING!'.format(self.channel))
             
-        self._instWrite('CHAN{}:LABel "{}"'.format(self.channel, label))
-        self._instWrite('DISPlay:LABel ON')
+        self._instWriteCompound(['CHAN{}:LABel "{}"'.format(self.channel, label),
+                                 'DISPlay:LABel ON'])
 
     def channelLabelOff(self):
         """ Turn off channel labels """
@@ -235,22 +251,25 @@ class Keysight(Oscilloscope):
             self.channel = channel
 
             # Make channel a list even if it is a single value
-            if type(self.channel) is not list:
-                chanlist = [self.channel]
-            else:
+            if isinstance(self.channel, list):
                 chanlist = self.channel
+            else:
+                chanlist = [self.channel]
 
             # Turn off all channels
             self.outputOffAll()
             
-            # Turn on selected channels
-            chanstr = ''
-            for chan in chanlist:                        
-                # Check channel value
-                if (chan not in self._chanAllValidList):
+            # Check channel values, skipping any invalid ones
+            viewlist = []
+            for chan in chanlist:
+                if (chan not in self.chanAllValidSet):
                     print('INVALID Channel Value for AUTOSCALE: {}  SKIPPING!'.format(chan))
                 else:
-                    self._instWrite("VIEW {}".format(chan))
+                    viewlist.append(chan)
+
+            # Turn on selected channels with a single compound command
+            if (viewlist):
+                self._instWriteCompound(["VIEW {}".format(chan) for chan in viewlist])
                     
         # Make sure Autoscale is only autoscaling displayed channels
         #@@@#self._instWrite("AUToscale:CHANnels DISPlayed")
@@ -779,7 +798,7 @@ class Keysight(Oscilloscope):
             raise ValueError('Channel cannot be a list for WAVEFORM!')
 
         # Check channel value
-        if (self.channel not in self.chanAllValidList):
+        if (self.channel not in self.chanAllValidSet):
             raise ValueError('INVALID Channel Value for WAVEFORM: {}  SKIPPING!'.format(self.channel))            
 
         
@@ -791,18 +810,64 @@ class Keysight(Oscilloscope):
         return (x, y, header, meta)
         
 
-    def _measureStatistics(self):
-        """Returns data from the current statistics window.
+    ## Keys of each dictionary returned by measureStatistics()
+    _statKeys = ('label',
+                 'CURR',               # Current Value
+                 'MIN',                # Minimum Value
+                 'MAX',                # Maximum Value
+                 'MEAN',               # Average/Mean Value
+                 'STDD',               # Standard Deviation
+                 'COUN')               # Count of measurements
+
+    def measureStatistics(self):
+        """Returns an array of dictionaries from the current statistics window.
+
+        The keys of each returned dictionary are listed in _statKeys.
+        """
+
+        # two-dimentional matrix with seven columns per row
+        statMat = self._measureStatistics(7)
+
+        # convert the numeric columns of all rows in a single pass
+        # through numpy's text parser instead of calling float() on
+        # each value
+        nums = np.fromstring(','.join(statMat[:,1:].ravel()), dtype=np.float64, sep=',')
+
+        # fromstring() stops at the first value it cannot parse, so
+        # make sure every value was converted, just as float() would
+        if (nums.size != statMat.shape[0]*6):
+            raise ValueError('Could not convert statistics values to numbers: {}'.format(','.join(statMat.ravel())))
+        nums = nums.reshape(-1,6)
+
+        # convert each row into a dictionary with the keys in _statKeys
+        stats = [dict(zip(self._statKeys, row))
+                 for row in zip(statMat[:,0], nums[:,0].tolist(), nums[:,1].tolist(),
+                                nums[:,2].tolist(), nums[:,3].tolist(), nums[:,4].tolist(),
+                                [int(c) for c in nums[:,5].tolist()])]
+
+        # return the result in an array of dictionaries
+        return stats
+
+    def _measureStatistics(self, cols=7):
+        """Returns data from the current statistics window as a
+        two-dimensional numpy array of strings with cols columns per row.
         """
 
         # tell Results? return all values (as opposed to just one of them)
         self._instWrite("MEASure:STATistics ON")
 
-        # create a list of the return values, which are seperated by a comma
-        statFlat = self._instQuery("MEASure:RESults?").split(',')
+        # The return values are seperated by a comma. NOTE: the
+        # labels are mixed in with the numbers and FORMat only
+        # applies to waveform data, so must read these as ASCII.
+        statFlat = np.array(self._instQuery("MEASure:RESults?").split(','), dtype=object)
+
+        # convert into a two-dimentional matrix with cols columns per row
+        if ((len(statFlat) % cols != 0)):
+            print('Unexpected response. Oscilloscope may not have any measurements enabled.')
+            return np.empty((0,cols), dtype=object)
 
-        # Return flat, uninterpreted data returned from command
-        return statFlat
+        # Return uninterpreted data returned from command
+        return statFlat.reshape(-1,cols)
     
 
     def _readDVM(self, mode, channel=None, timeout=None, wait=0.5):
@@ -982,6 +1047,12 @@ class Keysight(Oscilloscope):
            wait - if not None, number of seconds to wait before querying measurement
 
            install - if True, adds measurement to the statistics display
+
+           NOTE: While measureTblCallMany() is collecting queries
+           (self._measureQueries is not None), this only records the
+           query string and returns self.OverRange without waiting or
+           querying. So methods in _measureTbl must return the value
+           from this method unchanged.
         """
 
         # If a channel value is passed in, make it the
@@ -997,19 +1068,6 @@ class Keysight(Oscilloscope):
         if (self.channel not in self._chanAnaValidList):
             raise ValueError('INVALID Channel Value for MEASURE: {}  SKIPPING!'.format(self.channel))
             
-        # Next check if desired channel is the source, if not switch it
-        #
-        # NOTE: doing it this way so as to not possibly break the
-        # moving average since do not know if buffers are cleared when
-        # the SOURCE command is sent even if the channel does not
-        # change.
-        src = self._instQuery("MEASure:SOURce?")
-        #print("Source: {}".format(src))
-        if (self._chanNumber(src) != self.channel):
-            # Different channel so switch it
-            #print("Switching to {}".format(self.channel))
-            self._instWrite("MEASure:SOURce {}".format(self.channelStr(self.channel)))
-
         if (para):
             # Need to add parameters to the write and query strings
             strWr = "MEASure:{} {}".format(mode, para)
@@ -1018,6 +1076,15 @@ class Keysight(Oscilloscope):
             strWr = "MEASure:{}".format(mode)
             strQu = "MEASure:{}?".format(mode)
 
+        if (self._measureQueries is not None):
+            # Only collecting the query strings for measureTblCallMany()
+            if (install):
+                raise ValueError('Cannot install measurement {} while collecting queries'.format(mode))
+            self._measureQueries.append(strQu)
+            return self.OverRange
+
+        self._measureSource()
+
         if (install):
             # If desire to install the measurement, make sure the
             # statistics display is on and then use the command form of
@@ -1037,6 +1104,22 @@ class Keysight(Oscilloscope):
 
         return float(val)
 
+    def _measureSource(self):
+        """Make sure the current channel is the measurement source"""
+
+        # Check if desired channel is the source, if not switch it
+        #
+        # NOTE: doing it this way so as to not possibly break the
+        # moving average since do not know if buffers are cleared when
+        # the SOURCE command is sent even if the channel does not
+        # change.
+        src = self._instQuery("MEASure:SOURce?")
+        #print("Source: {}".format(src))
+        if (self._chanNumber(src) != self.channel):
+            # Different channel so switch it
+            #print("Switching to {}".format(self.channel))
+            self._instWrite("MEASure:SOURce {}".format(self.channelStr(self.channel)))
+
 
     def measureBitRate(self, channel=None, wait=0.25, install=False):
         """Measure and return the bit rate measurement.
@@ -1668,6 +1751,10 @@ class Keysight(Oscilloscope):
 
     ## This is a dictionary of measurement labels with their units and
     ## method to get the data from the scope.
+    ##
+    ## NOTE: measureTblCallMany() relies on each method returning the
+    ## value of a single _measure() call, unchanged, or
+    ## self.OverRange without calling _measure(). See _measure().
     _measureTbl = {
         'Bit Rate': ['Hz', measureBitRate],
         'Burst Width': ['s', measureBurstWidth],
@@ -1727,4 +1814,97 @@ class Keysight(Oscilloscope):
             value = self.OverRange
 
         return value
+
+    def measureTblCallMany(self, measList, channel=None, wait=0.25, compound=True):
+        """Gather all measurements in list 'measList' for channel and
+        return their values as a numpy array in the same order
+
+        Any measurement in measList that cannot be found in
+        _measureTbl, or is not supported, returns self.OverRange.
+
+        measList: a list of strings to be looked up in _measureTbl
+
+        channel: channel, as string, to be measured - default channel
+        for future readings
+
+        wait - if not None, number of seconds to wait before querying measurements
+
+        compound - if True, read all measurements with a single compound
+        query. Otherwise, or if the compound query response does not
+        have the expected number of values, query each measurement on
+        its own.
+        """
+
+        # Collect the query string of each measurement without sending them
+        self._measureQueries = []
+        qIndex = []
+        try:
+            for meas in measList:
+                start = len(self._measureQueries)
+                self.measureTblCall(meas, channel)
+                if (len(self._measureQueries) > start):
+                    qIndex.append(start)
+                else:
+                    qIndex.append(None)
+            queries = self._measureQueries
+        finally:
+            self._measureQueries = None
+
+        values = np.full(len(measList), self.OverRange)
+        if (not queries):
+            return values
+
+        self._measureSource()
+
+        # wait a little before read values, if wait is not None
+        if (wait):
+            sleep(wait)
+
+        results = None
+        if (compound):
+            # the results of a compound query are seperated by ';'
+            #
+            # NOTE: do not check errors as part of the query. If the
+            # oscilloscope times out, a late response to the compound
+            # query could be read as the response to SYSTem:ERRor?
+            queryStr = self._compoundStr(queries)
+            try:
+                results = np.fromstring(self._instQuery(queryStr, checkErrors=False), sep=';')
+            except visa.VisaIOError:
+                # oscilloscope may reject or time out on a long
+                # compound query, so fall through to one at a time
+                results = None
+
+            if (results is not None and len(results) == len(queries)):
+                self.checkInstErrors(queryStr)
+            else:
+                # Discard any late response and the errors caused by
+                # the compound query before trying one at a time
+                self._clearCompound()
+
+        if (results is None or len(results) != len(queries)):
+            # query the measurements one at a time
+            results = np.array([self._instQuery(qu) for qu in queries], dtype=np.float64)
+
+        for i, idx in enumerate(qIndex):
+            if (idx is not None):
+                values[i] = results[idx]
+
+        return values
+
+    def _clearCompound(self):
+        """Clear the instrument's output buffer and error queue after a
+        failed compound query"""
+
+        # NOTE: pyvisa-py does not support clear() for USB so ignore
+        # that error, just as open() does
+        try:
+            self._inst.clear()
+        except visa.VisaIOError as err:
+            if (err.error_code != visa.constants.StatusCode.error_nonsupported_operation):
+                raise
+
+        # Clear the error queue so these errors are not reported
+        # against the following queries
+        self.clear()
     
@@ -75,38 +75,6 @@ class MXR(Keysight):
         # Give the Series a name
         self._series = 'MXR'
 
-    def measureStatistics(self):
-        """Returns an array of dictionaries from the current statistics window.
-
-        The definition of the returned dictionary can be easily gleaned
-        from the code below.
-        """
-
-        statFlat = super(MXR, self)._measureStatistics()
-        
-        # convert the flat list into a two-dimentional matrix with seven columns per row
-        cols = 7
-        if ((len(statFlat) % cols != 0)):
-            print('Unexpected response. Oscilloscope may not have any measurements enabled.')
-            statMat = []
-        else:
-            statMat = [statFlat[i:i+cols] for i in range(0,len(statFlat),cols)]
-        
-        # convert each row into a dictionary, while converting text strings into numbers
-        stats = []
-        for stat in statMat:
-            stats.append({'label':stat[0],
-                          'CURR':float(stat[1]),     # Current Value
-                          'MIN':float(stat[2]),      # Minimum Value
-                          'MAX':float(stat[3]),      # Maximum Value
-                          'MEAN':float(stat[4]),     # Average/Mean Value
-                          'STDD':float(stat[5]),     # Standard Deviation
-                          'COUN':int(float(stat[6])) # Count of measurements
-                          })
-
-        # return the result in an array of dictionaries
-        return stats
-
     def setupAutoscale(self, channel=None):
         """ Autoscale desired channel, which is a string. channel can also be a list of multiple strings"""
 
@@ -86,6 +86,14 @@ class Oscilloscope(SCPI):
         # digital channels 8-15
         self._chanAllValidList = self._chanAnaValidList + [str(x) for x in ['POD1','POD2']]
 
+        # frozenset of _chanAllValidList for quick membership
+        # checks. Child classes extend _chanAllValidList in their
+        # __init__() so this gets created when it is first used.
+        self._chanAllValidSet = None
+
+        # cache of units looked up in _measureTbl by polish()
+        self._measureUnitsCache = {}
+
         # Give the Series a name
         self._series = 'GENERIC'
         
@@ -97,6 +105,12 @@ class Oscilloscope(SCPI):
     def chanAllValidList(self):
         return self._chanAllValidList
 
+    @property
+    def chanAllValidSet(self):
+        if self._chanAllValidSet is None:
+            self._chanAllValidSet = frozenset(self._chanAllValidList)
+        return self._chanAllValidSet
+
     @property
     def series(self):
         # Use this so can branch activities based on oscilloscope series name
@@ -415,14 +429,48 @@ class Oscilloscope(SCPI):
         if (value >= self.OverRange):
             pol = '------'
         else:
-            try:
-                pol = Quantity(value, self._measureTbl[measure][0])
-            except KeyError:
+            units = self._measureUnits(measure)
+            if (units is None):
                 # If measure is None or does not exist
                 pol = Quantity(value)
+            else:
+                pol = Quantity(value, units)
 
         return pol
 
+    def polishMany(self, values, measures=None):
+        """ Same as polish() but for a list or array of values with a
+        matching list of measure strings. Returns a list.
+
+        If measures is None, then no units are used for any of the values.
+
+        """
+
+        values = np.asarray(values, dtype=np.float64)
+        if (measures is None):
+            measures = [None] * len(values)
+        elif (len(measures) != len(values)):
+            raise ValueError('Number of measures ({}) does not match number of values ({})'.format(len(measures), len(values)))
+
+        return [self.polish(value, measure) for value, measure in zip(values.tolist(), measures)]
+
+    def _measureUnits(self, measure):
+        """Return the units of measure from _measureTbl, or None if
+        measure is None or does not exist. Results are cached since
+        the same measurements tend to be polished over and over.
+        """
+
+        if (measure in self._measureUnitsCache):
+            return self._measureUnitsCache[measure]
+
+        try:
+            units = self._measureTbl[measure][0]
+        except KeyError:
+            units = None
+
+        self._measureUnitsCache[measure] = units
+        return units
+
 
 if __name__ == '__main__':
     ## NOTE: This example code currently only works on oscilloscopes
@@ -456,7 +504,7 @@ if __name__ == '__main__':
                          instr.measurePosPulseWidth(install=True)))
 
     # Add an annotation to the screen before hardcopy
-    instr.annotate("{} {} {}".format('Example of Annotation','for Channel',instr.channel), 'ch1')
+    instr.annotate("Example of Annotation for Channel %s" % instr.channel, 'ch1')
 
     # Change label of the channel to "MySigx"
     instr.channelLabel("MySig{}".format(instr.channel))
@@ -514,16 +562,19 @@ if __name__ == '__main__':
                     'Average - Full Screen',
                     'RMS - Full Screen',
                     ]
-    for meas in measurements:
+    # using instr.measureTbl[] dictionary, gather all of the
+    # measurements with a single query. Blank strings simply return
+    # an unused, invalid value.
+    values = instr.measureTblCallMany(measurements)
+
+    # Using the same measurement names, pass them to the polishMany()
+    # method to format the data with units and SI suffix.
+    for meas, pol in zip(measurements, instr.polishMany(values, measurements)):
         if (meas == ''):
             # use a blank string to put in an extra line
             print()
         else:
-            # using instr.measureTbl[] dictionary, call the
-            # appropriate method to read the measurement. Also, using
-            # the same measurement name, pass it to the polish() method
-            # to format the data with units and SI suffix.
-            print('{: <24} {:>12.6}'.format(meas,instr.polish(instr.measureTblCall(meas), meas)))
+            print('{: <24} {:>12.6}'.format(meas,pol))
 
     # turn off the channel
     instr.outputOff()
@@ -69,6 +69,7 @@ class SCPI(object):
         self._wait = wait
         self._prefix = cmd_prefix
         self._curr_chan = 1                      # set the current channel to the first one
+        self._chanStrCache = {}                  # cache of channelStr() results
         self._read_strip = read_strip
         self._read_termination = read_termination
         self._write_termination = write_termination
@@ -125,6 +126,10 @@ class SCPI(object):
 
     @channel.setter
     def channel(self, value):
+        # Store a tuple of channels as a list so only need to check
+        # for a list when handling multiple channels
+        if isinstance(value, tuple):
+            value = list(value)
         self._curr_chan = value
 
     def _instQuery(self, queryStr, checkErrors=True):
@@ -168,6 +173,27 @@ class SCPI(object):
             self.checkInstErrors(writeStr)
         return result
 
+    def _compoundStr(self, cmdList):
+        """Join a list of commands or queries into a single compound
+        command string.
+
+        The commands after the first are seperated by ';:' so each
+        starts back at the root of the command tree - without the ':',
+        SCPI would treat them as relative to the previous command's
+        subsystem. Common commands, which start with '*', are seperated
+        by ';' alone. The first command is left as is so that
+        _instWrite()/_instQuery() add the command prefix to it as usual.
+        """
+        return cmdList[0] + ''.join(
+            (';' + cmd) if cmd[0] == '*' else (';:' + cmd) for cmd in cmdList[1:])
+
+    def _instWriteCompound(self, writeList, checkErrors=True):
+        """Send a list of commands to the instrument as a single compound
+        command, so that only one write is needed. See _compoundStr()
+        for how the commands are joined.
+        """
+        return self._instWrite(self._compoundStr(writeList), checkErrors)
+
     def chStr(self, channel):
         """return the channel string given the channel number and using the format CHx"""
 
@@ -181,6 +207,20 @@ class SCPI(object):
     def channelStr(self, channel):
         """return the channel string given the channel number and using the format CHANnelx if x is numeric. If pass in None, return None."""
 
+        # channel values come from a small set, so cache the results
+        try:
+            return self._chanStrCache[channel]
+        except KeyError:
+            chanStr = self._channelStr(channel)
+            self._chanStrCache[channel] = chanStr
+            return chanStr
+        except TypeError:
+            # channel is unhashable, like a list, so cannot cache it
+            return self._channelStr(channel)
+
+    def _channelStr(self, channel):
+        """Uncached implementation of channelStr()"""
+
         try:
             return 'CHAN{}'.format(int(channel))
         except TypeError: